@@ -2,7 +2,6 @@ from . import data_structures
 from . import io
 from .api import options
 from .api import enums
-from . import gui
 from . import image_utils
 from . import utils
 
@@ -15,3 +14,12 @@ __all__ = [
     "image_utils",
     "utils",
 ]
+
+
+def __getattr__(name):
+    # gui pulls in Qt and pyqtgraph, so it is only imported on first access
+    if name == "gui":
+        import importlib
+
+        return importlib.import_module(".gui", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
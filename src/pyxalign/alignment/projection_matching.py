@@ -1,18 +1,17 @@
 from functools import partial
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 import numpy as np
 import cupy as cp
 import copy
 from scipy.optimize import minimize
-from PyQt5.QtWidgets import QApplication
 
 from pyxalign.alignment.base import Aligner
 from pyxalign.api.options.projections import ProjectionTransformOptions
 from pyxalign.api.options.transform import ShiftOptions
 from pyxalign.api.options_utils import set_all_device_options
 import pyxalign.data_structures.projections as projections
+from pyxalign.interactions import _ensure_qt_initialized
 from pyxalign.interactions.utils.misc import switch_to_matplotlib_qt_backend
-from pyxalign.interactions.viewers.projection_matching import ProjectionMatchingViewer
 from pyxalign.regularization import chambolleLocalTV3D
 from pyxalign.style.text import text_colors
 from pyxalign.timing.timer_utils import InlineTimer, timer
@@ -29,6 +28,9 @@ import matplotlib.pyplot as plt
 from tqdm import tqdm
 import astra
 
+if TYPE_CHECKING:
+    from pyxalign.interactions.viewers.projection_matching import ProjectionMatchingViewer
+
 
 class ProjectionMatchingAligner(Aligner):
     @timer()
@@ -41,7 +43,7 @@ class ProjectionMatchingAligner(Aligner):
         super().__init__(projections, options)
         self.options: ProjectionMatchingOptions = self.options
         self.print_updates = print_updates
-        self.gui: ProjectionMatchingViewer = None
+        self.gui: "ProjectionMatchingViewer" = None
 
     @gutils.memory_releasing_error_handler
     @timer()
@@ -668,6 +670,10 @@ class ProjectionMatchingAligner(Aligner):
     @switch_to_matplotlib_qt_backend
     def run_with_GUI(self, initial_shift: np.ndarray):
         "Launches the PMA viewer gui and runs the PMA loop"
+        # Qt is only imported when a viewer is actually opened
+        from PyQt5.QtWidgets import QApplication
+        from pyxalign.interactions.viewers.projection_matching import ProjectionMatchingViewer
+
         app = QApplication.instance() or QApplication([])
         # Objective: make this interactive
         # I could delay starting the thread until after the user hits a button.
@@ -704,6 +710,10 @@ class ProjectionMatchingAligner(Aligner):
 
     def show_GUI(self):
         "Relaunch the viewer. Intended to be used after running PMA and closing the original gui."
+        _ensure_qt_initialized()
+        from PyQt5.QtWidgets import QApplication
+        from pyxalign.interactions.viewers.projection_matching import ProjectionMatchingViewer
+
         if self.gui is None:
             app = QApplication.instance() or QApplication([])
             self.gui = ProjectionMatchingViewer(self)
@@ -720,7 +730,7 @@ class ProjectionMatchingAligner(Aligner):
             self.iteration and self.options.plot.update.stride == 0
         ):
             # matplotlib.use("module://matplotlib_inline.backend_inline")
-            sort_idx = np.argsort(self.aligned_projections.angles)
+            sort_idx = self.aligned_projections.sort_idx
             sorted_angles = self.aligned_projections.angles[sort_idx]
             total_shift = self.total_shift[sort_idx]
             initial_shift = self.initial_shift[sort_idx]
@@ -862,7 +872,7 @@ class ProjectionMatchingAligner(Aligner):
         use_colorbars: bool = False,
     ):
         if sort:
-            sort_idx = np.argsort(self.aligned_projections.angles)
+            sort_idx = self.aligned_projections.sort_idx
         else:
             sort_idx = np.arange(0, len(dX), dtype=int)
 
@@ -89,6 +89,7 @@ class ShiftManagerMemberType(StrEnum):
 class PhaseUnwrapMethods(StrEnum):
     ITERATIVE_RESIDUAL_CORRECTION = auto()
     GRADIENT_INTEGRATION = auto()
+    IRLS = auto()
 
 
 class ImageGradientMethods(StrEnum):
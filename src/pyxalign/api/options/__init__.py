@@ -39,6 +39,7 @@ from .options import (
     RegularizationOptions,
     GradientIntegrationUnwrapOptions,
     IterativeResidualUnwrapOptions,
+    IRLSUnwrapOptions,
 )
 from .plotting import (
     UpdatePlotOptions,
@@ -93,6 +94,7 @@ __all__ = [
     "RegularizationOptions",
     "GradientIntegrationUnwrapOptions",
     "IterativeResidualUnwrapOptions",
+    "IRLSUnwrapOptions",
     # Plotting options
     "UpdatePlotOptions",
     "PlotDataOptions",
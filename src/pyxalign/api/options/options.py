@@ -93,6 +93,27 @@ class IterativeResidualUnwrapOptions:
     """
 
 
+@dataclasses.dataclass
+class IRLSUnwrapOptions:
+    irls_iterations: int = 5
+    "Number of reweighting steps used to approximate the L1-norm solution"
+
+    cg_iterations: int = 50
+    """
+    Number of conjugate-gradient iterations used to solve each weighted
+    least-squares problem
+    """
+
+    eps: float = 1e-2
+    "Lower bound on the gradient residual used when computing the weights"
+
+    use_masks: bool = True
+    """
+    Determines if the projection masks should be used to weight the
+    phase gradients
+    """
+
+
 @dataclasses.dataclass
 class PhaseUnwrapOptions:
     device: DeviceOptions = field(default_factory=DeviceOptions)
@@ -108,6 +129,10 @@ class PhaseUnwrapOptions:
         - can perform better if the IterativeResidualCorrection 
         unwrapping is producing large phase ramps
         - same unwrapping method that is used by pty-chi
+    - PhaseUnwrapMethods.IRLS
+        - L1-norm unwrapping by iteratively reweighted least squares
+        - less sensitive to phase residues than least-squares methods;
+        runs on the GPU when enabled in the device options
     """
 
     gradient_integration: GradientIntegrationUnwrapOptions = field(
@@ -120,6 +145,9 @@ class PhaseUnwrapOptions:
     )
     "Options for IterativeResidualCorrection unwrapping"
 
+    irls: IRLSUnwrapOptions = field(default_factory=IRLSUnwrapOptions)
+    "Options for IRLS unwrapping"
+
 
 @dataclasses.dataclass
 class RegularizationOptions:
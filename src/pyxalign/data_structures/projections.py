@@ -190,6 +190,16 @@ class Projections:
     def size(self):
         return self.data.shape[1:]
 
+    @property
+    def sort_idx(self) -> np.ndarray:
+        "Indices that sort the projections by angle"
+        return np.argsort(self.angles)
+
+    @property
+    def scan_title_strings(self) -> list[str]:
+        "Title string for each projection, for use in the GUI viewers"
+        return [f"scan {x}" for x in self.scan_numbers]
+
     @timer()
     def transform_projections(
         self,
@@ -604,7 +614,7 @@ class Projections:
                 fig.suptitle(title, fontsize=17)
             else:
                 fig.suptitle(default_titles[i], fontsize=17)
-            sort_idx = np.argsort(self.angles)
+            sort_idx = self.sort_idx
             plt.sca(ax[0])
             plt.plot(
                 self.angles[sort_idx],
@@ -769,7 +779,10 @@ class ComplexProjections(Projections):
         bool_2 = (
             self.options.phase_unwrap.method == enums.PhaseUnwrapMethods.GRADIENT_INTEGRATION
         ) and (self.options.phase_unwrap.gradient_integration.use_masks)
-        use_masks = bool_1 or bool_2
+        bool_3 = (self.options.phase_unwrap.method == enums.PhaseUnwrapMethods.IRLS) and (
+            self.options.phase_unwrap.irls.use_masks
+        )
+        use_masks = bool_1 or bool_2 or bool_3
         if use_masks is True and self.masks is None:
             raise ValueError(
                 "Phase unwrapping requires masks for the selected phase_unwrap settings, but masks do not exist"
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import numpy as np
 import h5py
 import copy
@@ -19,9 +19,11 @@ from pyxalign.api.types import r_type
 from pyxalign.io.load import load_ptycho_projections
 from pyxalign.io.save import save_generic_data_structure_to_h5
 from pyxalign.io.utils import load_options_from_h5_group
-from pyxalign.interactions.viewers.projection_matching import ProjectionMatchingViewer
 from pyxalign.timing.timer_utils import clear_timer_globals
 
+if TYPE_CHECKING:
+    from pyxalign.interactions.viewers.projection_matching import ProjectionMatchingViewer
+
 # from pyxalign.interactions.viewers.task import TaskViewer # causes circular imports
 # import pyxalign.interactions.viewers.task as task_viewer
 # import pyxalign.interactions.pma_runner as pma_runner
@@ -45,7 +47,7 @@ class LaminographyAlignmentTask:
         self.complex_projections = complex_projections
         self.phase_projections = phase_projections
         self.pma_object: ProjectionMatchingAligner = None
-        self.pma_gui_list: list[ProjectionMatchingViewer] = []
+        self.pma_gui_list: list["ProjectionMatchingViewer"] = []
 
     def get_cross_correlation_shift(
         self,
@@ -1,10 +1,24 @@
-from IPython import get_ipython
-import pyqtgraph as pg
+_qt_initialized = False
 
-pg.setConfigOption("background", "#242729")
 
+def _ensure_qt_initialized():
+    """Apply the pyqtgraph defaults and start the IPython Qt event loop.
 
-ipython = get_ipython()
-if ipython:
-    # ipython.magic("gui qt")
-    ipython.run_line_magic("gui", "qt")
+    This is deferred until a GUI is first created so that importing
+    pyxalign does not pull in pyqtgraph or touch the IPython kernel on
+    headless and batch jobs.
+    """
+    global _qt_initialized
+    if _qt_initialized:
+        return
+
+    from IPython import get_ipython
+    import pyqtgraph as pg
+
+    pg.setConfigOption("background", "#242729")
+
+    ipython = get_ipython()
+    if ipython:
+        # ipython.magic("gui qt")
+        ipython.run_line_magic("gui", "qt")
+    _qt_initialized = True
@@ -3,6 +3,7 @@ from typing import Callable, Optional
 
 import numpy as np
 import copy
+import dataclasses
 import pyqtgraph as pg
 import time
 
@@ -117,7 +118,7 @@ class CrossCorrelationMasterWidget(MultiThreadedWidget):
             pinned_results=self.pinned_array,
         )
 
-        sort_idx = np.argsort(self.projections.angles)
+        sort_idx = self.projections.sort_idx
         title_strings = [
             f", scan {scan}, angle {angle:0.2f}"
             for scan, angle in zip(self.projections.scan_numbers, self.projections.angles)
@@ -187,7 +188,7 @@ class CrossCorrelationMasterWidget(MultiThreadedWidget):
         ]
         self.pre_alignment_viewer = ArrayViewer(
             array3d=proj.data,
-            sort_idx=np.argsort(proj.angles),
+            sort_idx=proj.sort_idx,
             extra_title_strings_list=title_strings,
         )
         pre_align_label = QLabel("Pre Alignment")
@@ -238,7 +239,7 @@ class CrossCorrelationMasterWidget(MultiThreadedWidget):
 
     def update_shift_results_plot(self, shift: np.ndarray):
         self.plot_item.clear()
-        sort_idx = np.argsort(self.projections.angles)
+        sort_idx = self.projections.sort_idx
 
         # Plot horizontal and vertical shifts
         angles_sorted = self.projections.angles[sort_idx]
@@ -253,9 +254,11 @@ class CrossCorrelationMasterWidget(MultiThreadedWidget):
         self.plot_item.addLegend()
 
     def show_cropped_projections_viewer(self):
+        # the viewer only reads the cropped stack, so a view avoids copying it
+        crop_options = dataclasses.replace(self.options_editor._data.crop, return_view=True)
         self.crop_viewer = ArrayViewer(
-            array3d=Cropper(self.options_editor._data.crop).run(self.projections.data),
-            sort_idx=np.argsort(self.projections.angles),
+            array3d=Cropper(crop_options).run(self.projections.data),
+            sort_idx=self.projections.sort_idx,
         )
         # self.crop_viewer.setAttribute(Qt.WA_DeleteOnClose)
         self.crop_viewer.show()
@@ -6,7 +6,7 @@ from pyxalign.io.loaders.base import StandardData
 import sys
 import numpy as np
 from typing import Optional, Dict
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QSignalBlocker, QTimer
 from PyQt5.QtWidgets import (
     QApplication,
     QWidget,
@@ -245,13 +245,11 @@ class StandardDataViewer(QWidget):
         """
         # Prevent signals from looping
         if self.sender() == self.slider:
-            self.spinbox.blockSignals(True)
-            self.spinbox.setValue(value)
-            self.spinbox.blockSignals(False)
+            with QSignalBlocker(self.spinbox):
+                self.spinbox.setValue(value)
         elif self.sender() == self.spinbox:
-            self.slider.blockSignals(True)
-            self.slider.setValue(value)
-            self.slider.blockSignals(False)
+            with QSignalBlocker(self.slider):
+                self.slider.setValue(value)
 
         self._update_display(value)
 
@@ -34,7 +34,7 @@ from PyQt5.QtWidgets import (
     QStackedWidget,
     QProgressDialog,
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QSignalBlocker, pyqtSignal
 from pyxalign.interactions.utils.loading_display_tools import OverlayWidget, loading_bar_wrapper
 from pyxalign.interactions.utils.misc import switch_to_matplotlib_qt_backend
 from pyxalign.io.loaders.load_any import load_dataset_from_arbitrary_options
@@ -125,18 +125,17 @@ class SelectLoadSettingsWidget(QWidget):
             self.change_selected_options_editor(idx=self.experiment_type_combo.currentIndex())
 
     def insert_options_externally(self, options: OptionsClass):
-        self.experiment_type_combo.blockSignals(True)
-        # find the matching class
-        experiment_type = get_experiment_type_enum_from_options(options)
-        index = np.where(
-            [
-                experiment_type == self.experiment_type_combo.itemData(i)
-                for i in range(self.experiment_type_combo.count())
-            ]
-        )[0][0]
-        self.experiment_type_combo.setCurrentIndex(index)
-        self.display_new_options(options)
-        self.experiment_type_combo.blockSignals(False)
+        with QSignalBlocker(self.experiment_type_combo):
+            # find the matching class
+            experiment_type = get_experiment_type_enum_from_options(options)
+            index = np.where(
+                [
+                    experiment_type == self.experiment_type_combo.itemData(i)
+                    for i in range(self.experiment_type_combo.count())
+                ]
+            )[0][0]
+            self.experiment_type_combo.setCurrentIndex(index)
+            self.display_new_options(options)
 
     def change_selected_options_editor(self, idx: int):
         # Initialize the selected option type
@@ -0,0 +1,154 @@
+from PyQt5.QtWidgets import (
+    QDialog,
+    QMessageBox,
+    QInputDialog,
+    QVBoxLayout,
+    QCheckBox,
+    QDialogButtonBox,
+    QLabel,
+    QWidget,
+    QScrollArea,
+)
+from PyQt5.QtCore import Qt
+
+
+def get_user_input_gui(
+    options_list: list, prompt: str, allow_multiple_selections: bool
+) -> tuple[int | list[int], str | list[str]]:
+    """Get user input via PyQt5 dialogs.
+
+    If allow_multiple_selections is False, show a QInputDialog to select a single option.
+    If allow_multiple_selections is True, show a custom QDialog containing checkboxes
+    within a scroll area for multiple selections.
+
+    Returns
+    -------
+    (selection_idx, selection) : tuple
+        selection_idx: int or list[int] (0-based indices of selected items)
+        selection: str or list[str] (the corresponding selected item(s))
+    """
+    allowed_inputs = range(len(options_list))
+
+    if allow_multiple_selections:
+        # Show a dialog with checkboxes for multiple selections (with a "Select All" option)
+        dialog = MultipleSelectionDialog(options_list, prompt)
+        if dialog.exec_() == QDialog.Accepted:
+            selected_indices = dialog.get_selected_indices()
+            if not selected_indices:
+                # If the user didn't select anything, raise an error or handle as needed
+                raise ValueError("No selections were made in the dialog.")
+            # Convert to proper index list and retrieve option values
+            selection_idx = [i for i in selected_indices if i in allowed_inputs]
+            selection = [options_list[i] for i in selection_idx]
+            return (selection_idx, selection)
+        else:
+            # Dialog was canceled; handle as you see fit
+            raise ValueError("User canceled multiple-selection dialog.")
+    else:
+        # Show a single-select dialog using QInputDialog
+        items = [f"{i+1}. {option}" for i, option in enumerate(options_list)]
+        item_str, ok = QInputDialog.getItem(None, "Select One Option", prompt, items, 0, False)
+        if ok and item_str:
+            # The user picked e.g. "2. Some Value"; parse out the index
+            index_str = item_str.split(".")[0]
+            try:
+                selection_idx = int(index_str) - 1
+                if selection_idx not in allowed_inputs:
+                    raise ValueError(f"Selected index {selection_idx} is out of range.")
+                selection = options_list[selection_idx]
+                return (selection_idx, selection)
+            except ValueError:
+                raise ValueError("Could not parse the user's selection index.")
+        else:
+            raise ValueError("User canceled single-selection dialog.")
+
+
+class MultipleSelectionDialog(QDialog):
+    """A QDialog that displays a series of checkboxes for multiple selection
+    from a list, wrapped in a scroll area, including a "Select All"
+    checkbox."""
+
+    def __init__(self, options_list: list, prompt: str, parent: QWidget = None):
+        super().__init__(parent)
+        self.setWindowTitle("Select Multiple Options")
+
+        self.layout = QVBoxLayout()
+        self.setLayout(self.layout)
+
+        # Add a prompt at the top
+        self.label_prompt = QLabel(prompt)
+        self.layout.addWidget(self.label_prompt)
+
+        # Create a scroll area to wrap the checkboxes
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
+
+        # Widget that will contain the checkboxes
+        container_widget = QWidget()
+        self.container_layout = QVBoxLayout(container_widget)
+
+        # "Select All" checkbox
+        self.cb_select_all = QCheckBox("Select All", container_widget)
+        self.cb_select_all.stateChanged.connect(self.on_select_all_changed)
+        self.container_layout.addWidget(self.cb_select_all)
+
+        # Create checkboxes for each option
+        self.option_checkboxes = []
+        for i, option in enumerate(options_list):
+            cb = QCheckBox(f"{i+1}. {option}", container_widget)
+            self.option_checkboxes.append(cb)
+            self.container_layout.addWidget(cb)
+
+        self.scroll_area.setWidget(container_widget)
+        self.layout.addWidget(self.scroll_area)
+
+        # Add standard dialog buttons (OK/Cancel)
+        self.button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+        self.layout.addWidget(self.button_box)
+
+    def on_select_all_changed(self, state: int):
+        """When 'Select All' is checked, all individual checkboxes become
+        checked and disabled.
+
+        When 'Select All' is unchecked, they become unchecked and re-
+        enabled.
+        """
+        if state == Qt.Checked:
+            for cb in self.option_checkboxes:
+                cb.setChecked(True)
+                cb.setEnabled(False)
+        else:
+            for cb in self.option_checkboxes:
+                cb.setEnabled(True)
+                cb.setChecked(False)
+
+    def get_selected_indices(self) -> list[int]:
+        """Returns a list of indices corresponding to checked options.
+
+        If 'Select All' is checked, return the indices of all option
+        checkboxes.
+        """
+        if self.cb_select_all.isChecked():
+            return list(range(len(self.option_checkboxes)))
+        else:
+            return [idx for idx, cb in enumerate(self.option_checkboxes) if cb.isChecked()]
+
+
+def get_boolean_user_input_gui(prompt: str) -> bool:
+    """Get a boolean user input via a Yes/No QMessageBox.
+
+    Returns
+    -------
+    bool
+        True if the user selects 'Yes', otherwise False.
+    """
+    msg = QMessageBox()
+    msg.setIcon(QMessageBox.Question)
+    msg.setWindowTitle("Confirm")
+    msg.setText(prompt)
+    msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+    result = msg.exec_()
+
+    return result == QMessageBox.Yes
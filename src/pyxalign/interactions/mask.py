@@ -216,8 +216,7 @@ class ThresholdSelector(QWidget):
         # Signal wiring
         # -------------------------------------------------------------- #
 
-        self.slider.valueChanged.connect(self._update_plot)
-        self.spinbox.valueChanged.connect(self._update_plot)
+        self.index_selector.index_changed.connect(self._update_plot)
         self.play_button.clicked.connect(self._toggle_play)
         self.timer.timeout.connect(self._next_frame)
 
@@ -270,7 +269,7 @@ class ThresholdSelector(QWidget):
     def _next_frame(self) -> None:
         current = self.slider.value()
         next_idx = (current + 1) % self.num_frames
-        self.slider.setValue(next_idx)
+        self.index_selector.set_index_immediately(next_idx)
 
     # ------------------------------------------------------------------ #
     # Finish & emit
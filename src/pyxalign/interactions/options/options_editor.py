@@ -1,4 +1,4 @@
-from functools import wraps
+from functools import lru_cache, wraps
 import sys
 from dataclasses import fields, is_dataclass
 from enum import Enum
@@ -36,6 +36,14 @@ from pyxalign.api.types import OptionsClass
 from pyxalign.interactions.viewers.utils import OptionsDisplayWidget
 
 
+@lru_cache(maxsize=None)
+def _get_field_types(options_class: type) -> dict[str, Any]:
+    """Map each field name of a dataclass to its declared type. Cached per class
+    so that building an editor does not re-walk the dataclass fields for every
+    single field widget."""
+    return {f.name: f.type for f in fields(options_class)}
+
+
 class IntTupleInputWidget(QWidget):
     def __init__(self, field_value, field_name: str, data_obj: OptionsClass):
         super().__init__()
@@ -242,11 +250,7 @@ class SingleOptionEditor(QWidget):
             )
 
         # Find the field's declared type
-        self.field_type = None
-        for f in fields(type(data_obj)):
-            if f.name == field_name:
-                self.field_type = f.type
-                break
+        self.field_type = _get_field_types(type(data_obj)).get(field_name)
         # Fall back if not found
         if not self.field_type:
             self.field_type = type(getattr(data_obj, field_name, None))
@@ -595,15 +599,23 @@ class BasicOptionsEditor(QWidget):
         super().__init__(parent)
         self._data = data
         self.skip_fields = skip_fields
+        self._skip_fields_set = frozenset(skip_fields)
         self.advanced_options_list = advanced_options_list or []
         self.basic_options_list = basic_options_list or []
         self.enable_advanced_tab = enable_advanced_tab
         self.options_display = None
+        self._all_field_paths: Optional[list[str]] = None
         if label is None:
             label = "Options Editor"
 
         main_layout = QVBoxLayout()
         self.setLayout(main_layout)
+        # Style all field frames from one style sheet instead of parsing the
+        # same style sheet once per frame
+        self.setStyleSheet(
+            "QFrame#options_field_frame, QFrame#options_field_frame QFrame "
+            "{ background-color:lightGray; border:lightGray}"
+        )
 
         title = QLabel(label)
         title.setStyleSheet("QLabel {font-size: 16px;}")
@@ -804,8 +816,11 @@ class BasicOptionsEditor(QWidget):
         if not is_dataclass(data_obj):
             return
 
-        # Get all possible field paths for nested dataclass filtering
-        all_fields = get_all_attribute_names(self._data) if tab_type else []
+        # Get all possible field paths for nested dataclass filtering. This is
+        # called once per nested dataclass, so only walk the options once.
+        if tab_type and self._all_field_paths is None:
+            self._all_field_paths = get_all_attribute_names(self._data)
+        all_fields = self._all_field_paths if tab_type else []
 
         for f in fields(data_obj):
             field_name = f.name
@@ -891,9 +906,9 @@ class BasicOptionsEditor(QWidget):
 
     def wrap_in_frame(self, widget: QWidget) -> QFrame:
         frame = QFrame()
+        frame.setObjectName("options_field_frame")
         frame.setFrameShape(QFrame.Panel)
         frame.setLineWidth(1)
-        frame.setStyleSheet("QFrame { background-color:lightGray; border:lightGray}")
 
         frame_layout = QVBoxLayout(frame)
         frame_layout.setContentsMargins(4, 4, 4, 4)
@@ -903,8 +918,9 @@ class BasicOptionsEditor(QWidget):
     def _check_if_skipped_field(
         self, current_full_field_name: str, skip_fields: Optional[list[str]] = None
     ) -> bool:
-        fields_to_check = skip_fields if skip_fields is not None else self.skip_fields
-        return current_full_field_name in fields_to_check
+        if skip_fields is None or skip_fields is self.skip_fields:
+            return current_full_field_name in self._skip_fields_set
+        return current_full_field_name in skip_fields
 
     def initialize_viewer(self):
         self.options_display = OptionsDisplayWidget(self._data)
@@ -7,9 +7,8 @@ using configurable options and real-time visualization of results.
 
 import sys
 import traceback
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import numpy as np
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtWidgets import (
     QApplication,
@@ -20,12 +19,17 @@ from PyQt5.QtWidgets import (
     QSizePolicy,
 )
 
-from pyxalign.api.options.options import PhaseUnwrapOptions
-from pyxalign.data_structures.task import LaminographyAlignmentTask
+from pyxalign.interactions import _ensure_qt_initialized
 from pyxalign.interactions.custom import action_button_style_sheet
 from pyxalign.interactions.options.options_editor import BasicOptionsEditor
+from pyxalign.interactions.utils.loading_display_tools import loading_bar_wrapper
 from pyxalign.interactions.viewers.base import ArrayViewer
 
+if TYPE_CHECKING:
+    # only needed for type hints; importing the task pulls in the alignment
+    # and reconstruction modules
+    from pyxalign.data_structures.task import LaminographyAlignmentTask
+
 
 class PhaseUnwrapWidget(QWidget):
     """
@@ -44,9 +48,10 @@ class PhaseUnwrapWidget(QWidget):
     phase_unwrapped = pyqtSignal()#np.ndarray)
 
     def __init__(
-        self, task: LaminographyAlignmentTask, parent: Optional[QWidget] = None
+        self, task: "LaminographyAlignmentTask", parent: Optional[QWidget] = None
     ):
         super().__init__(parent)
+        _ensure_qt_initialized()
         self.setAttribute(Qt.WA_DeleteOnClose)
         self.task = task
 
@@ -93,7 +98,7 @@ class PhaseUnwrapWidget(QWidget):
         main_layout.addWidget(left_panel)
         main_layout.addWidget(self.array_viewer)
 
-    def set_task(self, task: LaminographyAlignmentTask):
+    def set_task(self, task: "LaminographyAlignmentTask"):
         """
         Set the LaminographyAlignmentTask for this widget.
 
@@ -126,16 +131,20 @@ class PhaseUnwrapWidget(QWidget):
             # # Update the task's phase unwrap options with current editor values
             # self.task.complex_projections.options.phase_unwrap = self.options_editor._data
 
-            # Perform phase unwrapping
+            # Perform phase unwrapping in a worker thread so the GUI stays
+            # responsive while the unwrap runs
             print("Starting phase unwrapping...")
-            self.task.get_unwrapped_phase()
+            unwrap_phase_wrapped = loading_bar_wrapper("Unwrapping phase...")(
+                func=self.task.get_unwrapped_phase
+            )
+            unwrap_phase_wrapped()
 
             # # Get the unwrapped phase data
             # unwrapped_phase = self.task.phase_projections.data
 
             # Update ArrayViewer with unwrapped phase
-            sort_idx = np.argsort(self.task.phase_projections.angles)
-            title_strings = [f"scan {x}" for x in self.task.phase_projections.scan_numbers]
+            sort_idx = self.task.phase_projections.sort_idx
+            title_strings = self.task.phase_projections.scan_title_strings
 
             self.array_viewer.reinitialize_all(
                 self.task.phase_projections.data,
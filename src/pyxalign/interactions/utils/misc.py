@@ -1,10 +1,13 @@
 from functools import wraps
 from IPython import get_ipython
 
+from pyxalign.interactions import _ensure_qt_initialized
+
 
 def switch_to_matplotlib_qt_backend(func):
     @wraps(func)
     def wrap(*args, **kwargs):
+        _ensure_qt_initialized()
         ipython = get_ipython()
         if ipython:
             ipython = get_ipython()
@@ -28,7 +28,7 @@ from PyQt5.QtWidgets import (
     QTableWidgetItem,
     QLabel,
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QSignalBlocker, pyqtSignal
 from matplotlib.backends.backend_qt5agg import (
     FigureCanvasQTAgg as FigureCanvas,
     NavigationToolbar2QT as NavigationToolbar,
@@ -151,7 +151,7 @@ class ProjectionViewer(MultiThreadedWidget):
             self.process_func = get_process_func_by_enum(options.process_func)
 
         if self.options.sort:
-            sort_idx = np.argsort(projections.angles)
+            sort_idx = projections.sort_idx
         else:
             sort_idx = None
         self.array_viewer = ArrayViewer(
@@ -455,9 +455,8 @@ class ScanRemovalTool(QWidget):
         )
         drop_projections_wrapped(remove_scan_numbers)
         # clear rows
-        self.staged_for_removal_table.blockSignals(True)
-        self.staged_for_removal_table.setRowCount(0)
-        self.staged_for_removal_table.blockSignals(False)
+        with QSignalBlocker(self.staged_for_removal_table):
+            self.staged_for_removal_table.setRowCount(0)
         # update table of dropped scans
         new_rows_count = len(remove_scan_numbers)
         for i in range(new_rows_count):
@@ -481,10 +480,9 @@ class ScanRemovalTool(QWidget):
                     row_index, self.file_path_column, QTableWidgetItem(file_path)
                 )
         # un-check scan removal checkbox
-        self.mark_for_removal_check_box.blockSignals(True)
-        self.mark_for_removal_check_box.setChecked(False)
-        self.mark_for_removal_check_box.blockSignals(False)
-        sort_idx = np.argsort(self.projections.angles)
+        with QSignalBlocker(self.mark_for_removal_check_box):
+            self.mark_for_removal_check_box.setChecked(False)
+        sort_idx = self.projections.sort_idx
         # re-initialize array viewer
         self.array_viewer.reinitialize_all(
             array3d=self.projections.data,
@@ -561,7 +559,7 @@ class AllShiftsViewer(MultiThreadedWidget):
 
         self.shifts_list = projections.shift_manager.past_shifts
         self.staged_shift = projections.shift_manager.staged_shift
-        self.sort_idx = np.argsort(projections.angles)
+        self.sort_idx = projections.sort_idx
         self.angles = projections.angles
         self.pixel_size = projections.pixel_size
         self.init_ui()
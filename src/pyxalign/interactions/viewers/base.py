@@ -28,6 +28,7 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import (
     Qt,
+    QSignalBlocker,
     QTimer,
     QRunnable,
     pyqtSlot,
@@ -149,7 +150,10 @@ class ArrayViewer(MultiThreadedWidget):
         # Create a pyqtgraph GraphicsLayoutWidget to hold the image
         self.graphics_layout = pg.GraphicsLayoutWidget()
         self.plot_item = self.graphics_layout.addPlot()
-        self.image_item = pg.ImageItem()
+        # Let pyqtgraph render a downsampled copy of each frame when the frame
+        # has more pixels than the view; coordinates stay in full-resolution
+        # pixels
+        self.image_item = pg.ImageItem(autoDownsample=True)
         self.plot_item.addItem(self.image_item)
         self.plot_item.setAspectLocked(True)
 
@@ -174,8 +178,7 @@ class ArrayViewer(MultiThreadedWidget):
             self.indexing_widget.play_button,
             self.indexing_widget.play_timer,
         )
-        self.slider.valueChanged.connect(self.update_frame)
-        self.spinbox.valueChanged.connect(self.update_frame)
+        self.indexing_widget.index_changed.connect(self.update_frame)
         self.play_button.clicked.connect(self.toggle_play)
         self.timer.timeout.connect(self.next_frame)
 
@@ -203,9 +206,9 @@ class ArrayViewer(MultiThreadedWidget):
 
         # If array3d was provided, show the initial image
         if self.array3d is not None:
-            self.display_frame(index=self.options.start_index)
-            # force scaling
-            self.image_item.setImage(autoLevels=True)
+            # compute the levels while drawing the first frame instead of
+            # drawing it and then rescaling it
+            self.display_frame(index=self.options.start_index, force_autolim=True)
 
     def display_frame(self, index=0, force_autolim: bool = False):
         """Display a given slice (frame) from array3d."""
@@ -252,7 +255,7 @@ class ArrayViewer(MultiThreadedWidget):
     def next_frame(self):
         current = self.slider.value()
         next_idx = (current + 1) % self.num_frames
-        self.slider.setValue(next_idx)
+        self.indexing_widget.set_index_immediately(next_idx)
 
     def refresh_frame(self, force_autolim: bool = False):
         self.update_frame(self.slider.value(), force_autolim=force_autolim)
@@ -345,6 +348,10 @@ class LinkedArrayViewer(MultiThreadedWidget):
 
 
 class IndexSelectorWidget(QWidget):
+    # Emitted once per index change. Changes made with the slider or
+    # spinbox are throttled to at most one emission per display refresh.
+    index_changed = pyqtSignal(int)
+
     def __init__(
         self,
         num_frames: int,
@@ -377,6 +384,17 @@ class IndexSelectorWidget(QWidget):
         self.spinbox.setValue(start_index)
         self.slider.valueChanged.connect(self.spinbox.setValue)
         self.spinbox.valueChanged.connect(self.slider.setValue)
+        # The spinbox is linked through the slider, so the slider emits once
+        # per index change. Drags emit once per mouse move, so the first
+        # change is passed on right away and later ones are held back to at
+        # most one every ~16 ms.
+        self._emit_index_immediately = False
+        self._index_change_pending = False
+        self.index_update_timer = QTimer(self)
+        self.index_update_timer.setSingleShot(True)
+        self.index_update_timer.setInterval(16)
+        self.index_update_timer.timeout.connect(self._emit_index_changed)
+        self.slider.valueChanged.connect(self._on_index_value_changed)
         # add spinbox to layout with label
         main_spinbox_widget = QWidget()
         main_spinbox_widget.setLayout(QVBoxLayout())
@@ -441,7 +459,10 @@ class IndexSelectorWidget(QWidget):
 
                 # link to primary indexing box
                 def update_extra_from_primary(i: int):
-                    sbox.setValue(sbox.allowed_values[i])
+                    # the primary index is already set, so don't let the
+                    # extra spinbox echo the change back to the slider
+                    with QSignalBlocker(sbox):
+                        sbox.setValue(sbox.allowed_values[i])
 
                 def update_primary_from_extra(i: int):
                     self.slider.setValue(np.where(np.array(sbox.allowed_values) == i)[0][0])
@@ -527,6 +548,31 @@ class IndexSelectorWidget(QWidget):
                 new_value = new_selected_value_list[i]
             self.extra_spinboxes_list[i].set_allowed_values(use_indexing, set_value_to=new_value)
 
+    def set_index_immediately(self, index: int):
+        """Set the index and emit `index_changed` without the throttle
+        applied to slider and spinbox changes. Used for playback so that
+        no frames are skipped."""
+        self._emit_index_immediately = True
+        try:
+            self.slider.setValue(index)
+        finally:
+            self._emit_index_immediately = False
+
+    def _on_index_value_changed(self, value: int):
+        if self._emit_index_immediately or not self.index_update_timer.isActive():
+            self._index_change_pending = False
+            self.index_changed.emit(value)
+            if not self._emit_index_immediately:
+                self.index_update_timer.start()
+        else:
+            self._index_change_pending = True
+
+    def _emit_index_changed(self):
+        if self._index_change_pending:
+            self._index_change_pending = False
+            self.index_changed.emit(self.slider.value())
+            self.index_update_timer.start()
+
     def _on_playback_speed_changed(self, value: int):
         interval = int(1e3 * 1 / value)
         self.play_timer.setInterval(interval)
@@ -248,7 +248,7 @@ class PMLinePlotWidget(QWidget):
     def __init__(self, pma_object: "pm.ProjectionMatchingAligner", parent=None):
         super().__init__(parent)
         self.pma_object = pma_object
-        self.sort_idx = np.argsort(self.pma_object.aligned_projections.angles)
+        self.sort_idx = self.pma_object.aligned_projections.sort_idx
         # if cp.get_array_module(self.sort_idx) is cp:
             # self.sort_idx = self.sort_idx.get()
         self.sort_idx = return_cpu_array(self.sort_idx)
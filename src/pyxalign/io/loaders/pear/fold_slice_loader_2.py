@@ -19,7 +19,7 @@ class FoldSliceLoaderVersion2(PEARNestedLoader):
     def load_single_projection(file_path: str) -> np.ndarray:
         "Load a single projection"
         try:
-            projection = loadmat(file_path)["object"]
+            projection = loadmat(file_path)["object"].astype(c_type, copy=False)
         except NotImplementedError as ex:
             with h5py.File(file_path, "r") as F:
                 projection = (F["object"]["real"] + 1j * F["object"]["imag"]).astype(c_type).transpose([1, 0])
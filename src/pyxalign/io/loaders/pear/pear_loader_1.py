@@ -19,7 +19,7 @@ class PearLoaderVersion1(PEARNestedLoader):
     def load_single_projection(file_path: str) -> np.ndarray:
         "Load a single projection"
         h5 = h5py.File(file_path, "r")
-        projection = h5["object"][()][0].astype(c_type)
+        projection = h5["object"][0].astype(c_type, copy=False)
         h5.close()
         return projection
 
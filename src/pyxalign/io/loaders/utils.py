@@ -1,4 +1,5 @@
 import multiprocessing as mp
+import sys
 from time import time
 import re
 from typing import Callable, Optional, Union
@@ -10,20 +11,8 @@ from tqdm import tqdm
 from pyxalign.transformations.functions import image_crop_pad
 import pyxalign.io.loaders.pear.options as pear_options
 from pyxalign.api.constants import divisor
+from pyxalign.interactions import _ensure_qt_initialized
 
-from PyQt5.QtWidgets import (
-    QDialog,
-    QMessageBox,
-    QInputDialog,
-    QVBoxLayout,
-    QCheckBox,
-    QDialogButtonBox,
-    QLabel,
-    QWidget,
-    QScrollArea,
-    QApplication,
-)
-from PyQt5.QtCore import Qt
 
 border = 60 * "-"
 
@@ -94,141 +83,34 @@ def prompt_input_processing(options_list: list, options_info_list: Optional[list
     return options_list, options_info_list
 
 
+def use_gui_prompts() -> bool:
+    """Return `True` if prompts should be shown as Qt dialogs instead of
+    in the terminal.
+
+    Dialogs are only used when a `QApplication` already exists. Qt is
+    initialized only in that case, so loaders that end up prompting in the
+    terminal never import PyQt5 or pyqtgraph.
+    """
+    qt_widgets = sys.modules.get("PyQt5.QtWidgets")
+    if qt_widgets is None or qt_widgets.QApplication.instance() is None:
+        return False
+    _ensure_qt_initialized()
+    return True
+
+
 def get_user_input(
     options_list: list,
     prompt: str,
     allow_multiple_selections: bool,
 ) -> tuple[Union[int, list[int]], ...]:
-    if QApplication.instance() is not None:
+    if use_gui_prompts():
+        from pyxalign.interactions.io.user_prompts import get_user_input_gui
+
         return get_user_input_gui(options_list, prompt, allow_multiple_selections)
     else:
         return get_user_input_terminal(options_list, prompt, allow_multiple_selections)
 
 
-def get_user_input_gui(
-    options_list: list, prompt: str, allow_multiple_selections: bool
-) -> tuple[int | list[int], str | list[str]]:
-    """Get user input via PyQt5 dialogs.
-
-    If allow_multiple_selections is False, show a QInputDialog to select a single option.
-    If allow_multiple_selections is True, show a custom QDialog containing checkboxes
-    within a scroll area for multiple selections.
-
-    Returns
-    -------
-    (selection_idx, selection) : tuple
-        selection_idx: int or list[int] (0-based indices of selected items)
-        selection: str or list[str] (the corresponding selected item(s))
-    """
-    allowed_inputs = range(len(options_list))
-
-    if allow_multiple_selections:
-        # Show a dialog with checkboxes for multiple selections (with a "Select All" option)
-        dialog = MultipleSelectionDialog(options_list, prompt)
-        if dialog.exec_() == QDialog.Accepted:
-            selected_indices = dialog.get_selected_indices()
-            if not selected_indices:
-                # If the user didn't select anything, raise an error or handle as needed
-                raise ValueError("No selections were made in the dialog.")
-            # Convert to proper index list and retrieve option values
-            selection_idx = [i for i in selected_indices if i in allowed_inputs]
-            selection = [options_list[i] for i in selection_idx]
-            return (selection_idx, selection)
-        else:
-            # Dialog was canceled; handle as you see fit
-            raise ValueError("User canceled multiple-selection dialog.")
-    else:
-        # Show a single-select dialog using QInputDialog
-        items = [f"{i+1}. {option}" for i, option in enumerate(options_list)]
-        item_str, ok = QInputDialog.getItem(None, "Select One Option", prompt, items, 0, False)
-        if ok and item_str:
-            # The user picked e.g. "2. Some Value"; parse out the index
-            index_str = item_str.split(".")[0]
-            try:
-                selection_idx = int(index_str) - 1
-                if selection_idx not in allowed_inputs:
-                    raise ValueError(f"Selected index {selection_idx} is out of range.")
-                selection = options_list[selection_idx]
-                return (selection_idx, selection)
-            except ValueError:
-                raise ValueError("Could not parse the user's selection index.")
-        else:
-            raise ValueError("User canceled single-selection dialog.")
-
-
-class MultipleSelectionDialog(QDialog):
-    """A QDialog that displays a series of checkboxes for multiple selection
-    from a list, wrapped in a scroll area, including a "Select All"
-    checkbox."""
-
-    def __init__(self, options_list: list, prompt: str, parent: QWidget = None):
-        super().__init__(parent)
-        self.setWindowTitle("Select Multiple Options")
-
-        self.layout = QVBoxLayout()
-        self.setLayout(self.layout)
-
-        # Add a prompt at the top
-        self.label_prompt = QLabel(prompt)
-        self.layout.addWidget(self.label_prompt)
-
-        # Create a scroll area to wrap the checkboxes
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-
-        # Widget that will contain the checkboxes
-        container_widget = QWidget()
-        self.container_layout = QVBoxLayout(container_widget)
-
-        # "Select All" checkbox
-        self.cb_select_all = QCheckBox("Select All", container_widget)
-        self.cb_select_all.stateChanged.connect(self.on_select_all_changed)
-        self.container_layout.addWidget(self.cb_select_all)
-
-        # Create checkboxes for each option
-        self.option_checkboxes = []
-        for i, option in enumerate(options_list):
-            cb = QCheckBox(f"{i+1}. {option}", container_widget)
-            self.option_checkboxes.append(cb)
-            self.container_layout.addWidget(cb)
-
-        self.scroll_area.setWidget(container_widget)
-        self.layout.addWidget(self.scroll_area)
-
-        # Add standard dialog buttons (OK/Cancel)
-        self.button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        self.button_box.accepted.connect(self.accept)
-        self.button_box.rejected.connect(self.reject)
-        self.layout.addWidget(self.button_box)
-
-    def on_select_all_changed(self, state: int):
-        """When 'Select All' is checked, all individual checkboxes become
-        checked and disabled.
-
-        When 'Select All' is unchecked, they become unchecked and re-
-        enabled.
-        """
-        if state == Qt.Checked:
-            for cb in self.option_checkboxes:
-                cb.setChecked(True)
-                cb.setEnabled(False)
-        else:
-            for cb in self.option_checkboxes:
-                cb.setEnabled(True)
-                cb.setChecked(False)
-
-    def get_selected_indices(self) -> list[int]:
-        """Returns a list of indices corresponding to checked options.
-
-        If 'Select All' is checked, return the indices of all option
-        checkboxes.
-        """
-        if self.cb_select_all.isChecked():
-            return list(range(len(self.option_checkboxes)))
-        else:
-            return [idx for idx, cb in enumerate(self.option_checkboxes) if cb.isChecked()]
-
-
 def get_user_input_terminal(
     options_list: list, prompt: str, allow_multiple_selections: bool
 ) -> tuple[Union[int, list[int]], ...]:
@@ -308,12 +190,12 @@ def generate_input_user_prompt(
     # Generate the user prompt
     if allow_multiple_selections:
         prompt = f"Select the {load_object_type_string} to load\n"
-        if QApplication.instance() is None:
+        if not use_gui_prompts():
             prompt += "Enter inputs as a series of integers seperated by spaces:\n"
     else:
         prompt = f"Select the {load_object_type_string} to load:\n"
 
-    if allow_multiple_selections and QApplication.instance() is None:
+    if allow_multiple_selections and not use_gui_prompts():
         options_list = [select_all_string] + options_list
         options_info_list = [""] + options_info_list
 
@@ -333,7 +215,7 @@ def generate_input_user_prompt(
         prompt,
         allow_multiple_selections=allow_multiple_selections,
     )
-    if allow_multiple_selections and QApplication.instance() is None:
+    if allow_multiple_selections and not use_gui_prompts():
         # Remove "select all" entry from options list
         options_list = options_list[1:]
         # Check if "select all" in selection
@@ -365,7 +247,9 @@ def parse_space_delimited_integers(input_string: str):
 
 
 def get_boolean_user_input(prompt: str) -> bool:
-    if QApplication.instance() is not None:
+    if use_gui_prompts():
+        from pyxalign.interactions.io.user_prompts import get_boolean_user_input_gui
+
         return get_boolean_user_input_gui(prompt)
     else:
         return get_boolean_user_input_terminal(prompt)
@@ -385,24 +269,6 @@ def get_boolean_user_input_terminal(prompt: str) -> bool:
             print("Invalid input. Please enter 'y' or 'n'.", flush=True)
 
 
-def get_boolean_user_input_gui(prompt: str) -> bool:
-    """Get a boolean user input via a Yes/No QMessageBox.
-
-    Returns
-    -------
-    bool
-        True if the user selects 'Yes', otherwise False.
-    """
-    msg = QMessageBox()
-    msg.setIcon(QMessageBox.Question)
-    msg.setWindowTitle("Confirm")
-    msg.setText(prompt)
-    msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-    result = msg.exec_()
-
-    return result == QMessageBox.Yes
-
-
 def convert_projection_dict_to_array(
     projections: dict[int, np.ndarray],
     new_shape: Optional[tuple] = None,
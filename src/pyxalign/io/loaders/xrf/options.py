@@ -26,7 +26,7 @@ class XRFHDF5Paths(StrEnum):
 
     ROI = "/MAPS/XRF_Analyzed/ROI/Counts_Per_Sec"
     NNLS = "/MAPS/XRF_Analyzed/NNLS/Counts_Per_Sec"
-    MATRIX = " /MAPS/XRF_Analyzed/Fitted/Counts_Per_Sec"
+    MATRIX = "/MAPS/XRF_Analyzed/Fitted/Counts_Per_Sec"
     LEGACY_ROI = "/MAPS/XRF_roi"
     LEGACY_MATRIX = "/MAPS/XRF_roi"
 
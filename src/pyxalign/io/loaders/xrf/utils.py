@@ -1,5 +1,5 @@
 import re
-from typing import TypeVar
+from typing import TypeVar, Union
 from tqdm import tqdm
 import h5py
 import os
@@ -73,14 +73,16 @@ def remove_scans_from_dict(
 
 def get_scan_file_dict(file_names: list[str], file_pattern: str) -> dict:  # -> list[int]:
     scan_file_dict = {}
+    # compile once instead of looking the pattern up in re's cache per file
+    compiled_pattern = re.compile(file_pattern)
     for name in file_names:
-        scan_number = extract_scan_number(name, file_pattern)
+        scan_number = extract_scan_number(name, compiled_pattern)
         if scan_number is not None:
             scan_file_dict[scan_number] = name
     return scan_file_dict
 
 
-def extract_scan_number(file_name: str, file_pattern: str) -> int:
+def extract_scan_number(file_name: str, file_pattern: Union[str, re.Pattern]) -> int:
     match = re.fullmatch(file_pattern, file_name)
     if match:
         return int(match.group(1))
@@ -16,6 +16,7 @@ from pyxalign.api.maps import get_process_func_by_enum
 from pyxalign.api.options.plotting import PlotDataOptions
 from matplotlib.image import AxesImage
 import copy
+import dataclasses
 from pyxalign.api.types import ArrayType
 from pyxalign.transformations.classes import Cropper
 
@@ -202,9 +203,8 @@ def plot_slice_of_3D_array(
     if cp.get_array_module(images) is cp:
         image = image.get()
 
-    crop_options = copy.deepcopy(options.crop)
-    crop_options.return_view = True
-    image = Cropper(options.crop).run(image[None])[0]
+    crop_options = dataclasses.replace(options.crop, return_view=True)
+    image = Cropper(crop_options).run(image[None])[0]
 
     if axis_image is not None:
         axis_image = axis_image.set_data(image)
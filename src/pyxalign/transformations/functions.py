@@ -29,14 +29,15 @@ def image_crop(
     else:
         image_dims = images.shape
 
-    image_center = np.array(image_dims) / 2 + [vertical_offset, horizontal_offset]
+    vertical_center = image_dims[0] / 2 + vertical_offset
+    horizontal_center = image_dims[1] / 2 + horizontal_offset
     vertical_index_start, vertical_index_end = (
-        int(image_center[0] - vertical_range / 2),
-        int(image_center[0] + vertical_range / 2),
+        int(vertical_center - vertical_range / 2),
+        int(vertical_center + vertical_range / 2),
     )
     horizontal_index_start, horizontal_index_end = (
-        int(image_center[1] - horizontal_range / 2),
-        int(image_center[1] + horizontal_range / 2),
+        int(horizontal_center - horizontal_range / 2),
+        int(horizontal_center + horizontal_range / 2),
     )
     if (
         horizontal_index_start < 0
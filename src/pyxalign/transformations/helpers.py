@@ -40,11 +40,7 @@ def round_to_divisor(
     elif round_type == RoundType.NEAREST:
         func = np.round
 
-    def rounding_func(x):
-        return int(func(x / divisor) * divisor)
-
-    if hasattr(input, "__len__"):
-        vectorized_rounding_func = np.vectorize(rounding_func)
-        return vectorized_rounding_func(input)
+    if np.ndim(input) > 0:
+        return (func(np.asarray(input) / divisor) * divisor).astype(int)
     else:
-        return rounding_func(input)
+        return int(func(input / divisor) * divisor)
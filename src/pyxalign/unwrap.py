@@ -21,8 +21,8 @@ def unwrap_phase(
     """Unwrap phase from complex images using specified method.
 
     This function serves as the main entry point for phase unwrapping operations.
-    It supports two different unwrapping methods: iterative residual correction
-    and gradient integration.
+    It supports three different unwrapping methods: iterative residual correction,
+    gradient integration, and iteratively reweighted least squares (IRLS).
 
     Args:
         images: Complex-valued images to unwrap. Shape should be (N, H, W) where
@@ -60,6 +60,18 @@ def unwrap_phase(
                 weight_map=weight_map,
                 deramp_polyfit_order=options.gradient_integration.deramp_polyfit_order,
             )
+    elif options.method == PhaseUnwrapMethods.IRLS:
+        if options.irls.use_masks:
+            weight_map = weights
+        else:
+            weight_map = None
+        unwrapped_phase = unwrap_phase_irls(
+            images,
+            weights=weight_map,
+            irls_iterations=options.irls.irls_iterations,
+            cg_iterations=options.irls.cg_iterations,
+            eps=options.irls.eps,
+        )
     return unwrapped_phase
 
 
@@ -137,11 +149,12 @@ def phase_unwrap_2D(images: ArrayType, weights: ArrayType, padding: int = 64):
     images = weights * images / (xp.abs(images) + 1e-10)
     del weights
 
-    pad_shape = xp.pad(images[0], padding, "symmetric").shape
-    padded_images = cp.zeros((len(images), pad_shape[0], pad_shape[1]), dtype=c_type)
-    if np.any(padding) > 0:
-        for i in range(len(images)):
-            padded_images[i] = xp.pad(images[i], padding, "symmetric")
+    # Pad the whole stack in one call instead of looping over projections
+    padded_images = xp.pad(
+        images.astype(c_type, copy=False),
+        ((0, 0), (padding, padding), (padding, padding)),
+        "symmetric",
+    )
 
     dX, dY = get_phase_gradient_fourier(padded_images)
     phase = xp.real(get_images_int_2D(dX, dY))
@@ -486,7 +499,10 @@ def integrate_image_2d_fourier(grad_y: ArrayType, grad_x: ArrayType) -> ArrayTyp
     shape = grad_y.shape
     # f = pmath.fft2_precise(grad_x + 1j * grad_y) # I am not using precise fft
     f = scipy_module.fft.fft2(grad_x + 1j * grad_y)
-    y, x = scipy_module.fft.fftfreq(shape[0]), scipy_module.fft.fftfreq(shape[1])
+    # keep the frequency grids in single precision so the integration is not
+    # promoted to complex128
+    y = scipy_module.fft.fftfreq(shape[0]).astype(r_type)
+    x = scipy_module.fft.fftfreq(shape[1]).astype(r_type)
 
     # In PtychoShelves' get_img_int_2D.m, they set the numerator of r to be
     # exp(2j * pi * (x + y[:, None])) to shift it by 1 pixel. We should NOT
@@ -563,8 +579,8 @@ def integrate_image_2d_deconvolution(
     scipy_module = get_scipy_module(grad_x)
 
     u, v = (
-        scipy_module.fft.fftfreq(grad_x.shape[0]),
-        scipy_module.fft.fftfreq(grad_x.shape[1]),
+        scipy_module.fft.fftfreq(grad_x.shape[0]).astype(r_type),
+        scipy_module.fft.fftfreq(grad_x.shape[1]).astype(r_type),
     )
     u, v = xp.meshgrid(u, v, indexing="ij")
     if tf_y is None or tf_x is None:
@@ -863,6 +879,176 @@ def torch_pad_to_numpy_pad(input, pad_lengths, mode="replicate"):
     return np.pad(input, pad_width=pad_width, mode=numpy_mode)
 
 
+#### Functions for unwrap_phase_irls ####
+@timer()
+def unwrap_phase_irls(
+    images: ArrayType,
+    weights: Optional[ArrayType] = None,
+    irls_iterations: int = 5,
+    cg_iterations: int = 50,
+    eps: float = 1e-2,
+) -> ArrayType:
+    """Unwrap phase using iteratively reweighted least squares (IRLS).
+
+    The L1-norm unwrapping problem, which minimizes the sum of
+    ``|grad(phi) - wrap(grad(psi))|``, is approximated by a sequence of
+    weighted least-squares problems. Each weighted problem
+    ``div(w * grad(phi)) = div(w * wrap(grad(psi)))`` is solved with
+    conjugate gradients, warm-started from the unweighted least-squares
+    solution. Every step only uses finite differences, FFT-based DCTs and
+    reductions, so the same code runs on numpy and cupy arrays.
+
+    Args:
+        images: Complex-valued images to unwrap. Shape should be (N, H, W).
+        weights: Weight arrays for each image. Values should be between 0 and 1.
+            If None, all pixels are weighted equally.
+        irls_iterations: Number of reweighting steps.
+        cg_iterations: Number of conjugate-gradient iterations used to solve
+            each weighted least-squares problem.
+        eps: Lower bound on the gradient residual used when computing the
+            IRLS weights ``w = 1 / max(|residual|, eps)``.
+
+    Returns:
+        Unwrapped phase arrays with the same shape as input images.
+    """
+    xp = cp.get_array_module(images)
+
+    wrapped_phase = xp.angle(images).astype(r_type, copy=False)
+    grad_y = wrap_phase(xp.diff(wrapped_phase, axis=1))
+    grad_x = wrap_phase(xp.diff(wrapped_phase, axis=2))
+    del wrapped_phase
+
+    # A gradient is only trusted as much as the least reliable of the two
+    # pixels it connects
+    if weights is not None:
+        weights = xp.clip(weights, 0, 1).astype(r_type, copy=False)
+        base_weights_y = xp.minimum(weights[:, 1:], weights[:, :-1])
+        base_weights_x = xp.minimum(weights[:, :, 1:], weights[:, :, :-1])
+    else:
+        base_weights_y = xp.ones_like(grad_y)
+        base_weights_x = xp.ones_like(grad_x)
+
+    phase = solve_poisson_neumann_dct(
+        diff_adjoint(grad_y, axis=1) + diff_adjoint(grad_x, axis=2)
+    )
+    weights_y, weights_x = base_weights_y, base_weights_x
+    for _ in range(irls_iterations):
+        phase = solve_weighted_least_squares_cg(
+            grad_y, grad_x, weights_y, weights_x, phase, cg_iterations
+        )
+        residual_y = xp.abs(xp.diff(phase, axis=1) - grad_y)
+        residual_x = xp.abs(xp.diff(phase, axis=2) - grad_x)
+        weights_y = base_weights_y / xp.maximum(residual_y, eps)
+        weights_x = base_weights_x / xp.maximum(residual_x, eps)
+
+    if weights is not None:
+        phase *= weights
+    return phase
+
+
+def wrap_phase(phase: ArrayType) -> ArrayType:
+    """Wrap phase values into the interval [-pi, pi)."""
+    xp = cp.get_array_module(phase)
+    return (phase + xp.pi) % (2 * xp.pi) - xp.pi
+
+
+def diff_adjoint(grad: ArrayType, axis: int) -> ArrayType:
+    """Apply the adjoint of ``xp.diff`` along `axis`.
+
+    For a stack of forward differences with one less element along
+    `axis`, this returns the negative backward difference with zero
+    boundary values, which has the shape of the original stack.
+    """
+    xp = cp.get_array_module(grad)
+    pad_width = [(0, 0)] * grad.ndim
+    pad_width[axis] = (1, 1)
+    return -xp.diff(xp.pad(grad, pad_width), axis=axis)
+
+
+def solve_poisson_neumann_dct(rhs: ArrayType) -> ArrayType:
+    """Solve ``-laplacian(phi) = rhs`` with Neumann boundaries using DCTs.
+
+    This is the exact solution of the unweighted least-squares unwrapping
+    problem (Ghiglia & Romero, 1994) and is used as the starting point for
+    the IRLS iterations.
+
+    Args:
+        rhs: Right-hand side of the equation. Shape should be (N, H, W).
+
+    Returns:
+        The zero-mean solution with the same shape as `rhs`.
+    """
+    xp = cp.get_array_module(rhs)
+    scipy_module: scipy = get_scipy_module(rhs)
+
+    n_y, n_x = rhs.shape[1:]
+    eigenvalues = (
+        4
+        - 2 * xp.cos(xp.pi * xp.arange(n_y, dtype=r_type) / n_y)[:, None]
+        - 2 * xp.cos(xp.pi * xp.arange(n_x, dtype=r_type) / n_x)
+    )
+    # the constant offset is undetermined; set it to zero
+    eigenvalues[0, 0] = 1
+    rhs_dct = scipy_module.fft.dctn(rhs, type=2, axes=(1, 2), norm="ortho")
+    rhs_dct /= eigenvalues
+    rhs_dct[:, 0, 0] = 0
+    return scipy_module.fft.idctn(rhs_dct, type=2, axes=(1, 2), norm="ortho").astype(
+        r_type, copy=False
+    )
+
+
+def solve_weighted_least_squares_cg(
+    grad_y: ArrayType,
+    grad_x: ArrayType,
+    weights_y: ArrayType,
+    weights_x: ArrayType,
+    phase: ArrayType,
+    iterations: int,
+) -> ArrayType:
+    """Solve ``div(w * grad(phi)) = div(w * g)`` with conjugate gradients.
+
+    Each image in the stack is solved independently; the step sizes are
+    computed per image so the whole stack is updated with batched array
+    operations.
+
+    Args:
+        grad_y: Target phase gradients along y. Shape should be (N, H - 1, W).
+        grad_x: Target phase gradients along x. Shape should be (N, H, W - 1).
+        weights_y: Weights of the y gradients. Same shape as `grad_y`.
+        weights_x: Weights of the x gradients. Same shape as `grad_x`.
+        phase: Initial guess of the phase. Shape should be (N, H, W).
+        iterations: Number of conjugate-gradient iterations.
+
+    Returns:
+        The updated phase estimate.
+    """
+    xp = cp.get_array_module(phase)
+    tiny = np.finfo(r_type).tiny
+
+    def apply_operator(x: ArrayType) -> ArrayType:
+        return diff_adjoint(weights_y * xp.diff(x, axis=1), axis=1) + diff_adjoint(
+            weights_x * xp.diff(x, axis=2), axis=2
+        )
+
+    rhs = diff_adjoint(weights_y * grad_y, axis=1) + diff_adjoint(weights_x * grad_x, axis=2)
+    residual = rhs - apply_operator(phase)
+    search_direction = residual.copy()
+    residual_norm = xp.sum(residual**2, axis=(1, 2), keepdims=True)
+    for _ in range(iterations):
+        operator_direction = apply_operator(search_direction)
+        step_size = residual_norm / xp.maximum(
+            xp.sum(search_direction * operator_direction, axis=(1, 2), keepdims=True), tiny
+        )
+        phase = phase + step_size * search_direction
+        residual = residual - step_size * operator_direction
+        new_residual_norm = xp.sum(residual**2, axis=(1, 2), keepdims=True)
+        search_direction = residual + (
+            new_residual_norm / xp.maximum(residual_norm, tiny)
+        ) * search_direction
+        residual_norm = new_residual_norm
+    return phase
+
+
 #### shared functions #### 
 def get_phase_gradient_fourier(images: ArrayType):
     """Compute phase gradients using Fourier differentiation.
@@ -0,0 +1,48 @@
+import numpy as np
+
+from pyxalign.api.enums import PhaseUnwrapMethods
+from pyxalign.api.options.options import IRLSUnwrapOptions, PhaseUnwrapOptions
+from pyxalign.unwrap import unwrap_phase, unwrap_phase_irls
+
+
+def make_smooth_phase(n_images: int = 2, size: int = 64, seed: int = 0) -> np.ndarray:
+    """Ramp plus a gaussian bump, spanning several multiples of 2*pi, with a
+    little noise added."""
+    rng = np.random.default_rng(seed)
+    y, x = np.meshgrid(np.arange(size), np.arange(size), indexing="ij")
+    bump = 8 * np.exp(-((x - size / 2) ** 2 + (y - size / 3) ** 2) / (2 * (size / 6) ** 2))
+    phase = np.stack([(0.3 + 0.1 * i) * x + 0.2 * y + bump for i in range(n_images)])
+    phase += rng.normal(scale=0.05, size=phase.shape)
+    return phase.astype(np.float32)
+
+
+def assert_equal_up_to_constant(result: np.ndarray, truth: np.ndarray, atol: float):
+    difference = result - truth
+    difference -= difference.mean(axis=(1, 2), keepdims=True)
+    assert np.abs(difference).max() < atol
+
+
+def test_unwrap_phase_irls_recovers_smooth_phase():
+    phase = make_smooth_phase()
+    assert np.ptp(phase) > 4 * np.pi
+    images = np.exp(1j * phase).astype(np.complex64)
+
+    unwrapped = unwrap_phase_irls(images, irls_iterations=5, cg_iterations=50)
+
+    assert unwrapped.shape == phase.shape
+    assert unwrapped.dtype == np.float32
+    assert_equal_up_to_constant(unwrapped, phase, atol=1e-3)
+
+
+def test_unwrap_phase_dispatches_to_irls_with_masks():
+    phase = make_smooth_phase(n_images=1, seed=1)
+    images = np.exp(1j * phase).astype(np.complex64)
+    weights = np.ones(phase.shape, dtype=np.float32)
+    options = PhaseUnwrapOptions(
+        method=PhaseUnwrapMethods.IRLS,
+        irls=IRLSUnwrapOptions(use_masks=True),
+    )
+
+    unwrapped = unwrap_phase(images, weights, options)
+
+    assert_equal_up_to_constant(unwrapped, phase, atol=1e-3)